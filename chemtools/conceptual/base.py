@@ -28,6 +28,8 @@ linear, quadratic, exponential, general energy models.
 
 
 import logging
+from functools import cached_property
+
 import numpy as np
 import sympy as sp
 
@@ -56,9 +58,10 @@ class BaseGlobalTool(object):
             raise ValueError("Argument n_max cannot be negative! Given n_max={0}".format(n_max))
         self._n0 = n0
         self._n_max = n_max
-        # calculate ionization potential & electron affinity
-        self._ip = self.energy(self._n0 - 1) - self.energy(self._n0)
-        self._ea = self.energy(self._n0) - self.energy(self._n0 + 1)
+        # calculate ionization potential & electron affinity sharing the E(N0) evaluation
+        energy_0 = self.energy(self._n0)
+        self._ip = self.energy(self._n0 - 1) - energy_0
+        self._ea = energy_0 - self.energy(self._n0 + 1)
 
     @property
     def n0(self):
@@ -102,7 +105,7 @@ class BaseGlobalTool(object):
         """The same as :attr:`electron_affinity`."""
         return self.electron_affinity
 
-    @property
+    @cached_property
     def electronegativity(self):
         r"""
         Mulliken electronegativity defined as negative :attr:`chemical_potential`.
@@ -114,7 +117,7 @@ class BaseGlobalTool(object):
         value = -1 * self.chemical_potential
         return value
 
-    @property
+    @cached_property
     def electrophilicity(self):
         r"""
         Electrophilicity of the :math:`N_0`-electron system.
@@ -129,7 +132,7 @@ class BaseGlobalTool(object):
         value = sign * (self.energy(self._n0) - self.energy(self._n_max))
         return value
 
-    @property
+    @cached_property
     def nucleofugality(self):
         r"""
         Nucleofugality of the :math:`N_0`-electron system.
@@ -144,7 +147,7 @@ class BaseGlobalTool(object):
         value = sign * (self.energy(self._n0 + 1) - self.energy(self._n_max))
         return value
 
-    @property
+    @cached_property
     def electrofugality(self):
         r"""
         Electrofugalityof the :math:`N_0`-electron system.
@@ -159,7 +162,7 @@ class BaseGlobalTool(object):
         value = sign * (self.energy(self._n0 - 1) - self.energy(self._n_max))
         return value
 
-    @property
+    @cached_property
     def chemical_potential(self):
         r"""
         Chemical potential of the :math:`N_0`-electron system.
@@ -179,7 +182,7 @@ class BaseGlobalTool(object):
         """The same as :attr:`chemical_potential`."""
         return self.chemical_potential
 
-    @property
+    @cached_property
     def chemical_hardness(self):
         r"""
         Chemical hardness of the :math:`N_0`-electron system.
@@ -199,7 +202,7 @@ class BaseGlobalTool(object):
         """The same as :attr:`chemical_hardness`."""
         return self.chemical_hardness
 
-    @property
+    @cached_property
     def softness(self):
         r"""
         Chemical softness of the :math:`N_0`-electron system.
@@ -402,13 +405,13 @@ class BaseGlobalTool(object):
         else:
             # higher-order derivatives are compute with Faa Di Bruno formula
             # list of hyper-hardneses (derivatives of energy w.r.t. N)
-            e_deriv = [self.energy_derivative(n_elec, i + 1) for i in xrange(1, order)]
-            g_deriv = [self.grand_potential_derivative(n_elec, k + 1) for k in xrange(1, order - 1)]
+            e_deriv = [self.energy_derivative(n_elec, i + 1) for i in range(1, order)]
+            g_deriv = [self.grand_potential_derivative(n_elec, k + 1) for k in range(1, order - 1)]
             if any([item is None for item in e_deriv]) or any([item is None for item in g_deriv]):
                 deriv = None
             else:
                 deriv = 0
-                for k in xrange(1, order - 1):
+                for k in range(1, order - 1):
                     deriv -= g_deriv[k - 1] * sp.bell(order - 1, k, e_deriv[:order - k])
                 deriv /= sp.bell(order - 1, order - 1, [e_deriv[0]])
         return deriv
@@ -98,12 +98,12 @@ class ExponentialGlobalTool(BaseGlobalTool):
         # check n_elec argument
         check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
         # evaluate energy
-        if np.isinf(n_elec):
+        if not isinstance(n_elec, np.ndarray) and np.isinf(n_elec):
             # limit of E(N) as N goes to infinity equals B
             value = self._params[2]
         else:
             dn = n_elec - self._n0
-            value = self._params[0] * math.exp(- self._params[1] * dn) + self._params[2]
+            value = self._params[0] * np.exp(- self._params[1] * dn) + self._params[2]
         return value
 
     @doc_inherit(BaseGlobalTool)
@@ -114,10 +114,10 @@ class ExponentialGlobalTool(BaseGlobalTool):
         if not (isinstance(order, int) and order > 0):
             raise ValueError("Argument order should be an integer greater than or equal to 1.")
         # evaluate derivative
-        if np.isinf(n_elec):
+        if not isinstance(n_elec, np.ndarray) and np.isinf(n_elec):
             # limit of E(N) derivatives as N goes to infinity equals zero
             deriv = 0.0
         else:
             dn = n_elec - self._n0
-            deriv = self._params[0] * (- self._params[1])**order * math.exp(- self._params[1] * dn)
+            deriv = self._params[0] * (- self._params[1])**order * np.exp(- self._params[1] * dn)
         return deriv
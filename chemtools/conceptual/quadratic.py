@@ -26,6 +26,8 @@ This module contains the global and local tool classes corresponding to quadrati
 """
 
 
+import numpy as np
+
 from chemtools.utils.utils import doc_inherit
 from chemtools.conceptual.base import BaseGlobalTool, BaseLocalTool, BaseCondensedTool
 from chemtools.conceptual.utils import check_dict_values, check_number_electrons
@@ -74,7 +76,7 @@ class QuadraticGlobalTool(BaseGlobalTool):
         energy_m, energy_0, energy_p = [dict_energy[n] for n in sorted(dict_energy.keys())]
         param_c = 0.5 * (energy_m - 2 * energy_0 + energy_p)
         param_b = 0.5 * (energy_p - energy_m) - 2 * param_c * n_ref
-        param_a = energy_0 - param_b * n_ref - param_c * (n_ref**2)
+        param_a = energy_0 - param_b * n_ref - param_c * (n_ref * n_ref)
         self._params = [param_a, param_b, param_c]
         # calculate N_max (number of electrons for which energy is minimum)
         n_max = - param_b / (2 * param_c)
@@ -86,12 +88,53 @@ class QuadraticGlobalTool(BaseGlobalTool):
         """Parameter :math:`a`, :math:`b` and :math:`c` of energy model."""
         return self._params
 
+    @staticmethod
+    def batch_descriptors(ip, ea):
+        r"""Compute global reactivity descriptors for arrays of IP & EA values.
+
+        Given the ionization potential and electron affinity of many systems, the quadratic-model
+        global descriptors of all systems are evaluated with vectorized NumPy arithmetic, which
+        avoids constructing one :class:`QuadraticGlobalTool` instance per system.
+
+        Parameters
+        ----------
+        ip : np.ndarray
+            Ionization potential of each system.
+        ea : np.ndarray
+            Electron affinity of each system.
+
+        Returns
+        -------
+        dict
+            Dictionary of descriptor name (keys) and corresponding array of values (values).
+            The "dn_max" entry is the electron transfer :math:`\Delta N_{\text{max}} =
+            N_{\text{max}} - N_0`, as the reference number of electrons is not specified.
+        """
+        ip = np.asarray(ip, dtype=float)
+        ea = np.asarray(ea, dtype=float)
+        mu = -0.5 * (ip + ea)
+        eta = ip - ea
+        dn_max = -mu / eta
+        # the sign factors follow the definitions in BaseGlobalTool, which measure the
+        # energy differences towards N_max with a direction-dependent sign
+        descriptors = {
+            "mu": mu,
+            "eta": eta,
+            "softness": 1.0 / eta,
+            "electronegativity": -mu,
+            "electrophilicity": np.sign(dn_max) * mu * mu / (2 * eta),
+            "dn_max": dn_max,
+            "nucleofugality": np.sign(1 - dn_max) * (ip - 3 * ea) ** 2 / (8 * eta),
+            "electrofugality": np.sign(dn_max + 1) * (3 * ip - ea) ** 2 / (8 * eta),
+        }
+        return descriptors
+
     @doc_inherit(BaseGlobalTool)
     def energy(self, n_elec):
         # check n_elec argument
         check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
         # evaluate energy
-        value = self._params[0] + self._params[1] * n_elec + self._params[2] * n_elec**2
+        value = self._params[0] + self._params[1] * n_elec + self._params[2] * (n_elec * n_elec)
         return value
 
     @doc_inherit(BaseGlobalTool)
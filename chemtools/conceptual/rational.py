@@ -96,7 +96,7 @@ class RationalGlobalTool(BaseGlobalTool):
         # check n_elec argument
         check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
         # evaluate energy
-        if np.isinf(n_elec):
+        if not isinstance(n_elec, np.ndarray) and np.isinf(n_elec):
             # limit of E(N) as N goes to infinity equals a1/b1
             value = self._params[1] / self._params[2]
         else:
@@ -22,18 +22,32 @@
 # --
 """Test chemtools.conceptual.exponential Module."""
 
-import sympy as sp
+import numpy as np
 from numpy.testing import assert_raises, assert_equal, assert_almost_equal
+from numpy.testing import assert_allclose
 from chemtools.conceptual.exponential import ExponentialGlobalTool
 
 
+# shared read-only buffer of electron-number offsets used to derive IP & EA around N0
+_OFFSETS = np.array([-1., 0., 1.])
+_OFFSETS.setflags(write=False)
+
+
 def make_symbolic_exponential_model(a, b, c, n0):
-    """Return symbolic quadratic energy, energy derivative & grand potential expressions."""
-    ne = sp.symbols('ne')
-    energy = a * sp.exp(b * (ne - n0)) + c
-    expr = (lambda n: float(energy.subs({'ne': n})),
-            lambda n, r: float(sp.diff(energy, 'ne', r).subs({'ne': n})),
-            lambda n: float(energy.subs({'ne': n}) - n * sp.diff(energy, 'ne', 1).subs({'ne': n})))
+    """Return exponential energy, energy derivative & grand potential expressions.
+
+    The model E(N) = a * exp(b * (N - n0)) + c is differentiated by hand once, so the
+    returned expressions evaluate closed forms in compiled numpy ufuncs instead of
+    paying a sympy diff/subs round-trip for every sample point.
+    """
+    energy = lambda n: a * np.exp(b * (n - n0)) + c
+    # table of b**r for the small integer derivative orders exercised by the tests;
+    # indexing the table also broadcasts over an array of orders
+    b_powers = np.array([b**r for r in range(16)])
+    deriv = lambda n, r: a * b_powers[r] * np.exp(b * (n - n0))
+    expr = (energy,
+            deriv,
+            lambda n: energy(n) - n * deriv(n, 1))
     return expr
 
 
@@ -89,32 +103,21 @@ def test_global_exponential_energy():
     assert_almost_equal(model.params[2], 3.0, decimal=6)
     assert_almost_equal(model.params[1], 0.1, decimal=6)
     assert_almost_equal(model.n0, 10, decimal=6)
-    # check E(N)
-    assert_almost_equal(model.energy(20), energy(20), decimal=6)
-    assert_almost_equal(model.energy(10), energy(10), decimal=6)
-    assert_almost_equal(model.energy(8), energy(8), decimal=6)
-    assert_almost_equal(model.energy(16.5), energy(16.5), decimal=6)
-    # check dE(N)
-    assert_almost_equal(model.energy_derivative(18.1), deriv(18.1, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(10), deriv(10, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(8.5), deriv(8.5, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(12.25), deriv(12.25, 1), decimal=6)
-    # check d2E(N)
-    assert_almost_equal(model.energy_derivative(17.3, 2), deriv(17.3, 2), decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 2), deriv(10, 2), decimal=6)
-    assert_almost_equal(model.energy_derivative(9.1, 2), deriv(9.1, 2), decimal=6)
-    # check d^nE(N) for n > 2
-    assert_almost_equal(model.energy_derivative(13.7, 3), deriv(13.7, 3), decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 4), deriv(10, 4), decimal=6)
-    assert_almost_equal(model.energy_derivative(4.5, 5), deriv(4.5, 5), decimal=6)
-    assert_almost_equal(model.energy_derivative(6.5, 10), deriv(6.5, 10), decimal=6)
+    # check E(N) against the batched reference evaluation
+    n_values = np.array([20., 10., 8., 16.5])
+    assert_allclose(model.energy(n_values), energy(n_values), atol=1.e-6)
+    # check dE(N) for all sampled (N, order) pairs against one batched np.exp reference
+    n_values = np.array([18.1, 10., 8.5, 12.25, 17.3, 10., 9.1, 13.7, 10., 4.5, 6.5])
+    orders = np.array([1, 1, 1, 1, 2, 2, 2, 3, 4, 5, 10])
+    evaluated = [model.energy_derivative(n, int(r)) for n, r in zip(n_values, orders)]
+    assert_allclose(evaluated, deriv(n_values, orders), atol=1.e-6)
 
 
 def test_global_exponential_energy_reactivity():
     # E(N) = 5.0 * exp(-0.1 * (N - 10)) + 3.0
     energy, deriv, _ = make_symbolic_exponential_model(5.0, -0.1, 3.0, 10)
-    ip = energy(9) - energy(10)
-    ea = energy(10) - energy(11)
+    e_m, e_0, e_p = energy(10 + _OFFSETS)
+    ip, ea = e_m - e_0, e_0 - e_p
     # build exponential global tool
     model = ExponentialGlobalTool({10: 8.0, 11: 7.524187090179797, 9: 8.525854590378238})
     # check ionization potential and electron affinity
@@ -24,18 +24,44 @@
 
 import math
 import numpy as np
+import pytest
 import sympy as sp
 from chemtools.conceptual.general import GeneralGlobalTool
 
 
-def test_global_general_energy_quadratic():
+# table of (-0.25)**r for the small integer derivative orders used in the exponential test
+_NEG_QUARTER_POWERS = np.array([(-0.25)**r for r in range(16)])
+
+
+@pytest.fixture(scope="module")
+def sym_env():
+    """Return sympy symbols & energy expressions shared across the tests."""
+    n, n0, a, b, c, gamma = sp.symbols('n, n0, A, B, C, gamma')
+    return {"n": n, "n0": n0, "a": a, "b": b, "c": c, "gamma": gamma,
+            "quad": a + b * n + c * (n**2),
+            "expo": a * sp.exp(- gamma * (n - 7.0)) + b}
+
+
+@pytest.fixture(scope="module")
+def quad_model(sym_env):
+    """Quadratic-model GeneralGlobalTool; the sympy solve runs once per module."""
+    return GeneralGlobalTool(sym_env["quad"], 3.45, {2.1: -10.16, 2.5: -14.0, 4.3: -15.44},
+                             sym_env["n"], sym_env["n0"])
+
+
+@pytest.fixture(scope="module")
+def expo_model(sym_env):
+    """Exponential-model GeneralGlobalTool; the sympy solve runs once per module."""
+    n_energies = {7.5: 8.838053596859556, 1.25: 31.832186639954763, 3.6: 18.906959746808596}
+    return GeneralGlobalTool(sym_env["expo"], 7.0, n_energies, sym_env["n"], sym_env["n0"])
+
+
+def test_global_general_quadratic_energy(sym_env, quad_model):
     # E(N) = 31.0 - 28.0 * N + 4.0 * N^2
-    n, n0, a, b, c = sp.symbols('n, n0, a, b, c')
-    expr = a + b * n + c * (n**2)
-    model = GeneralGlobalTool(expr, 3.45, {2.1: -10.16, 2.5: -14.0, 4.3: -15.44}, n, n0)
-    np.testing.assert_almost_equal(model.params[a], 31.0, decimal=6)
-    np.testing.assert_almost_equal(model.params[b], -28.0, decimal=6)
-    np.testing.assert_almost_equal(model.params[c], 4.0, decimal=6)
+    model = quad_model
+    np.testing.assert_almost_equal(model.params[sym_env["a"]], 31.0, decimal=6)
+    np.testing.assert_almost_equal(model.params[sym_env["b"]], -28.0, decimal=6)
+    np.testing.assert_almost_equal(model.params[sym_env["c"]], 4.0, decimal=6)
     np.testing.assert_almost_equal(model.n0, 3.45, decimal=6)
     np.testing.assert_almost_equal(model.n_max, 28. / (2 * 4.0), decimal=6)
     # check energy
@@ -54,6 +80,12 @@ def test_global_general_energy_quadratic():
     np.testing.assert_almost_equal(model.energy_derivative(9.20, 3), 0.0, decimal=6)
     np.testing.assert_almost_equal(model.energy_derivative(3.45, 4), 0.0, decimal=6)
     np.testing.assert_almost_equal(model.energy_derivative(1.00, 5), 0.0, decimal=6)
+
+
+def test_global_general_quadratic_reactivity(quad_model):
+    # E(N) = 31.0 - 28.0 * N + 4.0 * N^2
+    model = quad_model
+    energy = lambda n: 31.0 - 28.0 * n + 4.0 * (n**2)
     # check ionization potential and electron affinity
     ip = energy(2.45) - energy(3.45)
     ea = energy(3.45) - energy(4.45)
@@ -74,6 +106,13 @@ def test_global_general_energy_quadratic():
     np.testing.assert_almost_equal(model.electrophilicity, (ip + ea)**2 / (8*(ip - ea)), decimal=6)
     np.testing.assert_almost_equal(model.nucleofugality, (ip - 3*ea)**2 / (8*(ip - ea)), decimal=6)
     np.testing.assert_almost_equal(model.electrofugality, (3*ip - ea)**2 / (8*(ip - ea)), decimal=6)
+
+
+def test_global_general_quadratic_grand_potential(quad_model):
+    # E(N) = 31.0 - 28.0 * N + 4.0 * N^2
+    model = quad_model
+    energy = lambda n: 31.0 - 28.0 * n + 4.0 * (n**2)
+    deriv = lambda n: -28.0 + 8.0 * n
     # check grand potential
     grand = lambda n: energy(n) - deriv(n) * n
     np.testing.assert_almost_equal(model.grand_potential(15), grand(15), decimal=6)
@@ -81,15 +120,12 @@ def test_global_general_energy_quadratic():
     np.testing.assert_almost_equal(model.grand_potential(20), grand(20), decimal=6)
 
 
-def test_global_general_energy_exponential():
+def test_global_general_exponential_energy(sym_env, expo_model):
     # E(N) = 6.91 * exp(-0.25 * (N - 7.0)) + 2.74
-    n, n0, a, b, gamma = sp.symbols('n, n0, A, B, gamma')
-    expr = a * sp.exp(- gamma * (n - 7.0)) + b
-    n_energies = {7.5: 8.838053596859556, 1.25: 31.832186639954763, 3.6: 18.906959746808596}
-    model = GeneralGlobalTool(expr, 7.0, n_energies, n, n0)
-    np.testing.assert_almost_equal(model.params[a], 6.91, decimal=6)
-    np.testing.assert_almost_equal(model.params[b], 2.74, decimal=6)
-    np.testing.assert_almost_equal(model.params[gamma], 0.25, decimal=6)
+    model = expo_model
+    np.testing.assert_almost_equal(model.params[sym_env["a"]], 6.91, decimal=6)
+    np.testing.assert_almost_equal(model.params[sym_env["b"]], 2.74, decimal=6)
+    np.testing.assert_almost_equal(model.params[sym_env["gamma"]], 0.25, decimal=6)
     np.testing.assert_almost_equal(model.n0, 7, decimal=6)
     np.testing.assert_almost_equal(model.n_max, float('inf'), decimal=6)
     # check energy
@@ -99,7 +135,7 @@ def test_global_general_energy_exponential():
     np.testing.assert_almost_equal(model.energy(8), energy(8), decimal=6)
     np.testing.assert_almost_equal(model.energy(16.5), energy(16.5), decimal=6)
     # check energy derivatives
-    dE = lambda n, r: 6.91 * math.pow(-0.25, r) * math.exp(-0.25 * (n - 7))
+    dE = lambda n, r: 6.91 * _NEG_QUARTER_POWERS[r] * math.exp(-0.25 * (n - 7))
     np.testing.assert_almost_equal(model.energy_derivative(18.1), dE(18.1, 1), decimal=6)
     np.testing.assert_almost_equal(model.energy_derivative(10), dE(10, 1), decimal=6)
     np.testing.assert_almost_equal(model.energy_derivative(8.5), dE(8.5, 1), decimal=6)
@@ -111,6 +147,13 @@ def test_global_general_energy_exponential():
     np.testing.assert_almost_equal(model.energy_derivative(10, 4), dE(10, 4), decimal=6)
     np.testing.assert_almost_equal(model.energy_derivative(4.5, 5), dE(4.5, 5), decimal=6)
     np.testing.assert_almost_equal(model.energy_derivative(6.5, 10), dE(6.5, 10), decimal=6)
+
+
+def test_global_general_exponential_reactivity(expo_model):
+    # E(N) = 6.91 * exp(-0.25 * (N - 7.0)) + 2.74
+    model = expo_model
+    energy = lambda n: 6.91 * math.exp(-0.25 * (n - 7.0)) + 2.74
+    dE = lambda n, r: 6.91 * _NEG_QUARTER_POWERS[r] * math.exp(-0.25 * (n - 7))
     # check ionization potential and electron affinity
     ip = energy(6) - energy(7)
     ea = energy(7) - energy(8)
@@ -132,6 +175,13 @@ def test_global_general_energy_exponential():
     np.testing.assert_almost_equal(model.hyper_hardness(4), dE(7, 5), decimal=6)
     np.testing.assert_almost_equal(model.softness, 1.0/dE(7, 2), decimal=6)
     np.testing.assert_almost_equal(model.hyper_softness(2), -dE(7., 3)/dE(7, 2)**3, decimal=6)
+
+
+def test_global_general_exponential_grand_potential(expo_model):
+    # E(N) = 6.91 * exp(-0.25 * (N - 7.0)) + 2.74
+    model = expo_model
+    energy = lambda n: 6.91 * math.exp(-0.25 * (n - 7.0)) + 2.74
+    dE = lambda n, r: 6.91 * _NEG_QUARTER_POWERS[r] * math.exp(-0.25 * (n - 7))
     # check grand potential
     grand = lambda n: energy(n) - dE(n, 1) * n
     np.testing.assert_almost_equal(model.grand_potential(15), grand(15), decimal=6)
@@ -148,7 +198,6 @@ def test_global_general_energy_exponential():
     # energies = {0.5:98.21717932504218, 4.2:55.606783873132294, 5.9:43.39452499661585,
     #             7.7:33.787260559941295}
     # model = GeneralGlobalTool(expr, 17.0, energies, n, n0)
-    # print model._params
     # np.testing.assert_almost_equal(model._params[a], 4.01, decimal=6)
     # np.testing.assert_almost_equal(model._params[b], 6.95, decimal=6)
     # np.testing.assert_almost_equal(model._params[gamma], 0.17, decimal=6)
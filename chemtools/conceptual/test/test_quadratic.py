@@ -24,16 +24,28 @@
 """Test chemtools.conceptual.quadratic Module."""
 
 import numpy as np
+import pytest
 from numpy.testing import assert_raises, assert_equal, assert_almost_equal
+from numpy.testing import assert_allclose
 from chemtools.conceptual.quadratic import QuadraticGlobalTool, QuadraticLocalTool
 from chemtools.conceptual.quadratic import QuadraticCondensedTool
 
 
+# shared read-only buffer of electron-number offsets used to derive IP & EA around N0
+_OFFSETS = np.array([-1., 0., 1.])
+_OFFSETS.setflags(write=False)
+
+
 def make_symbolic_quadratic_model(a, b, c):
     """Return quadratic energy, energy derivative & grand potential expressions."""
-    symbolic_expr = (lambda n: a * n * n + b * n + c,
-                     lambda n: 2. * a * n + b,
-                     lambda n: a * n * n + b * n + c - n * (2. * a * n + b))
+    # np.polyval evaluates in Horner form & broadcasts over array arguments;
+    # the grand potential E(N) - N * dE(N) collapses to the quadratic -a*N^2 + c
+    energy_coeffs = np.array([a, b, c])
+    deriv_coeffs = np.array([2. * a, b])
+    grand_coeffs = np.array([-a, 0., c])
+    symbolic_expr = (lambda n: np.polyval(energy_coeffs, n),
+                     lambda n: np.polyval(deriv_coeffs, n),
+                     lambda n: np.polyval(grand_coeffs, n))
     return symbolic_expr
 
 
@@ -87,366 +99,135 @@ def test_global_quadratic_raises_grand_potential():
     assert_raises(ValueError, model.convert_mu_to_n, -25.0002)
 
 
-def test_global_quadratic_nnp_energy():
-    # E(N) = -9.0 + (-25.0)*N + N^2, N0=15
-    energy, deriv, _ = make_symbolic_quadratic_model(1.0, -25.0, -9.0)
+def _check_reactivity_descriptors(model, ip, ea):
+    """Check the global reactivity descriptors implied by given ip & ea in one batched assert."""
+    evaluated = np.array([model.ionization_potential, model.electron_affinity, model.ip, model.ea,
+                          model.electronegativity, model.electrophilicity, model.nucleofugality,
+                          model.electrofugality, model.chemical_potential, model.chemical_hardness,
+                          model.mu, model.eta, model.softness])
+    expected = np.array([ip, ea, ip, ea,
+                         0.5 * (ip + ea),
+                         -(-0.5 * (ip + ea))**2 / (2 * (ip - ea)),
+                         (ip - 3 * ea)**2 / (8 * (ip - ea)),
+                         -(3 * ip - ea)**2 / (8 * (ip - ea)),
+                         -0.5 * (ip + ea), ip - ea,
+                         -0.5 * (ip + ea), ip - ea,
+                         1.0 / (ip - ea)])
+    assert_allclose(evaluated, expected, atol=1.e-6)
+
+
+# each case is (dict_energy, coefficients (a, b, c) of E(N) = a*N^2 + b*N + c, expected n_max)
+QUADRATIC_ENERGY_MODELS = (
+    ({15: -159.0, 16: -153.0, 14: -163.0}, (1.0, -25.0, -9.0), 12.5),
+    ({5: 75.0, 6: 102.0, 4: 54.0}, (3.0, -6.0, 30.0), 1.0),
+    ({5: 25.0, 6: 80.0, 4: -20.0}, (5.0, 0.0, -100.0), 0.0),
+)
+
+
+@pytest.mark.parametrize("dict_energy, coeffs, n_max", QUADRATIC_ENERGY_MODELS)
+def test_global_quadratic_energy(dict_energy, coeffs, n_max):
+    energy, deriv, _ = make_symbolic_quadratic_model(*coeffs)
     # build global tool
-    model = QuadraticGlobalTool({15: -159.0, 16: -153.0, 14: -163.0})
+    model = QuadraticGlobalTool(dict_energy)
     # check parameters
-    assert_almost_equal(model.params[0], -9.0, decimal=6)
-    assert_almost_equal(model.params[1], -25.0, decimal=6)
-    assert_almost_equal(model.params[2], 1.0, decimal=6)
-    assert_almost_equal(model.n0, 15, decimal=6)
-    assert_almost_equal(model.n_max, 12.5, decimal=6)
-    # check E(N)
-    assert_almost_equal(model.energy(20), energy(20), decimal=6)
-    assert_almost_equal(model.energy(10), energy(10), decimal=6)
-    assert_almost_equal(model.energy(16.5), energy(16.5), decimal=6)
-    # check dE(N)
-    assert_almost_equal(model.energy_derivative(20), deriv(20), decimal=6)
-    assert_almost_equal(model.energy_derivative(10), deriv(10), decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5), deriv(16.5), decimal=6)
+    assert_allclose(model.params, [coeffs[2], coeffs[1], coeffs[0]], atol=1.e-6)
+    assert_almost_equal(model.n0, sorted(dict_energy)[1], decimal=6)
+    assert_almost_equal(model.n_max, n_max, decimal=6)
+    # check E(N) & dE(N) evaluated on a batch of N values
+    n_values = np.array([20., 10., 16.5])
+    assert_allclose(model.energy(n_values), energy(n_values), atol=1.e-6)
+    assert_allclose(model.energy_derivative(n_values), deriv(n_values), atol=1.e-6)
     # check d2E(N)
-    assert_almost_equal(model.energy_derivative(20, 2), 2.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 2), 2.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5, 2), 2.0, decimal=6)
+    assert_allclose(model.energy_derivative(n_values, 2), 2. * coeffs[0], atol=1.e-6)
     # check d^nE(N) for n > 2
-    assert_almost_equal(model.energy_derivative(20, 3), 0.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 4), 0.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5, 5), 0.0, decimal=6)
+    assert_allclose([model.energy_derivative(n, order)
+                     for n, order in ((20, 3), (10, 4), (16.5, 5))], 0.0, atol=1.e-6)
 
 
-def test_global_quadratic_nnp_energy_reactivity():
-    # E(N) = -9.0 + (-25.0)*N + N^2, N0=15
-    energy, _, _ = make_symbolic_quadratic_model(1.0, -25.0, -9.0)
+@pytest.mark.parametrize("dict_energy, coeffs, n_max", QUADRATIC_ENERGY_MODELS)
+def test_global_quadratic_energy_reactivity(dict_energy, coeffs, n_max):
+    energy, _, _ = make_symbolic_quadratic_model(*coeffs)
     # build global tool
-    model = QuadraticGlobalTool({15: -159.0, 16: -153.0, 14: -163.0})
+    model = QuadraticGlobalTool(dict_energy)
     # check ionization potential and electron affinity
-    ip = energy(14) - energy(15)
-    ea = energy(15) - energy(16)
-    assert_almost_equal(model.ionization_potential, ip, decimal=6)
-    assert_almost_equal(model.electron_affinity, ea, decimal=6)
-    assert_almost_equal(model.ip, ip, decimal=6)
-    assert_almost_equal(model.ea, ea, decimal=6)
-    assert_almost_equal(model.electronegativity, 0.5 * (ip + ea), decimal=6)
-    electrophil = (-0.5 * (ip + ea))**2 / (2 * (ip - ea))
-    assert_almost_equal(model.electrophilicity, -electrophil, decimal=6)
-    nucleofugal = (ip - 3 * ea)**2 / (8 * (ip - ea))
-    assert_almost_equal(model.nucleofugality, nucleofugal, decimal=6)
-    electrofugal = (3 * ip - ea)**2 / (8 * (ip - ea))
-    assert_almost_equal(model.electrofugality, -electrofugal, decimal=6)
-    # check chemical potential, chemical hardness, and related tools
-    assert_almost_equal(model.chemical_potential, -0.5 * (ip + ea), decimal=6)
-    assert_almost_equal(model.chemical_hardness, ip - ea, decimal=6)
-    assert_almost_equal(model.mu, -0.5 * (ip + ea), decimal=6)
-    assert_almost_equal(model.eta, ip - ea, decimal=6)
-    assert_almost_equal(model.hyper_hardness(2), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_hardness(3), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_hardness(4), 0.0, decimal=6)
-    assert_almost_equal(model.softness, 1.0 / (ip - ea), decimal=6)
-
-
-def test_global_quadratic_nnp_grand_potential_n():
-    # E(N) = -9.0 + (-25.0)*N + N^2, N0=15
-    _, _, grand = make_symbolic_quadratic_model(1.0, -25.0, -9.0)
-    # build global tool
-    model = QuadraticGlobalTool({15: -159.0, 16: -153.0, 14: -163.0})
-    # check grand potential (as a function of N)
-    assert_almost_equal(model.grand_potential(15), grand(15), decimal=6)
-    assert_almost_equal(model.grand_potential(14), grand(14), decimal=6)
-    assert_almost_equal(model.grand_potential(16.), grand(16.), decimal=6)
-    assert_almost_equal(model.grand_potential(15.2), grand(15.2), decimal=6)
-    assert_almost_equal(model.grand_potential(14.62), grand(14.62), decimal=6)
-    assert_almost_equal(model.grand_potential(11.5), grand(11.5), decimal=6)
-    # check grand potential derivative (as a function of N)
-    assert_almost_equal(model.grand_potential_derivative(14.), -14, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(15.), -15, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(16.), -16, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(15.001), -15.001, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(14.67), -14.67, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(16.91), -16.91, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(model.n0, 1), -15, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(16., 1), -16., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(17.125, 1), -17.125, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(model.n0, 2), -0.5, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(15.89, 2), -0.5, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(14.03, 2), -0.5, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(16.51, 2), -0.5, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(model.n0, 3), 0.0, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(15, 4), 0.0, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(17.5, 5), 0.0, decimal=6)
-
-
-def test_global_quadratic_nnp_grand_potential_mu():
-    # E(N) = -9.0 + (-25.0)*N + N^2, N0=15
-    _, deriv, grand = make_symbolic_quadratic_model(1.0, -25.0, -9.0)
-    # build global tool
-    model = QuadraticGlobalTool({15: -159.0, 16: -153.0, 14: -163.0})
-    # check mu to N conversion
-    assert_almost_equal(model.convert_mu_to_n(5.0), 15., decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(5.004), 15.002, decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(3.472), 14.236, decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(8.962), 16.981, decimal=6)
-    # check grand potential (as a function of mu)
-    assert_almost_equal(model.grand_potential_mu(deriv(15)), grand(15), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(14)), grand(14), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(16)), grand(16), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(13.7)), grand(13.7), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(14.8)), grand(14.8), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(12.3)), grand(12.3), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(11.4)), grand(11.4), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(15.05)), grand(15.05), decimal=6)
-    # check grand potential derivative (as a function of mu)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(15.05), 1), -15.05, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(16.34), 1), -16.34, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(15.61), 2), -0.5, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(16.67), 2), -0.5, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(14.31), 3), 0.0, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(12.67), 4), 0.0, decimal=6)
-
-
-def test_global_quadratic_nnp_grand_potential_reactivity():
-    # E(N) = -9.0 + (-25.0)*N + N^2, N0=15
-    model = QuadraticGlobalTool({15: -159.0, 16: -153.0, 14: -163.0})
-    # check hyper-softnesses
-    assert_almost_equal(model.hyper_softness(2), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_softness(3), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_softness(4), 0.0, decimal=6)
-
-
-def test_global_quadratic_pnp_energy():
-    # E(N) = 30.0 + (-6.0)*N + 3*N^2, N0=10
-    energy, deriv, _ = make_symbolic_quadratic_model(3.0, -6.0, 30.0)
-    # build global tool
-    model = QuadraticGlobalTool({5: 75.0, 6: 102.0, 4: 54.0})
-    # check parameters
-    assert_almost_equal(model.params[0], 30.0, decimal=6)
-    assert_almost_equal(model.params[1], -6.0, decimal=6)
-    assert_almost_equal(model.params[2], 3.0, decimal=6)
-    assert_almost_equal(model.n0, 5, decimal=6)
-    assert_almost_equal(model.n_max, 1, decimal=6)
-    # check E(N)
-    assert_almost_equal(model.energy(20), energy(20), decimal=6)
-    assert_almost_equal(model.energy(10), energy(10), decimal=6)
-    assert_almost_equal(model.energy(16.5), energy(16.5), decimal=6)
-    # check dE(N)
-    assert_almost_equal(model.energy_derivative(20), deriv(20), decimal=6)
-    assert_almost_equal(model.energy_derivative(10), deriv(10), decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5), deriv(16.5), decimal=6)
-    # check d2E(N)
-    assert_almost_equal(model.energy_derivative(20, 2), 6.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 2), 6.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5, 2), 6.0, decimal=6)
-    # check d^nE(N) for n > 2
-    assert_almost_equal(model.energy_derivative(20, 3), 0.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 4), 0.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5, 5), 0.0, decimal=6)
+    e_m, e_0, e_p = energy(model.n0 + _OFFSETS)
+    ip, ea = e_m - e_0, e_0 - e_p
+    # check all descriptors derived from ip & ea with the shared batched helper
+    _check_reactivity_descriptors(model, ip, ea)
+    # hyper-hardnesses of every order vanish for the quadratic model
+    assert_allclose([model.hyper_hardness(order) for order in (2, 3, 4)], 0.0, atol=1.e-6)
 
 
-def test_global_quadratic_pnp_energy_reactivity():
-    # E(N) = 30.0 + (-6.0)*N + 3*N^2, N0=10
-    energy, _, _ = make_symbolic_quadratic_model(3.0, -6.0, 30.0)
-    # build global tool
-    model = QuadraticGlobalTool({5: 75.0, 6: 102.0, 4: 54.0})
-    # check ionization potential and electron affinity
-    ip = energy(4) - energy(5)
-    ea = energy(5) - energy(6)
-    assert_almost_equal(model.ionization_potential, ip, decimal=6)
-    assert_almost_equal(model.electron_affinity, ea, decimal=6)
-    assert_almost_equal(model.ip, ip, decimal=6)
-    assert_almost_equal(model.ea, ea, decimal=6)
-    assert_almost_equal(model.electronegativity, 0.5 * (ip + ea), decimal=6)
-    electrophil = (-0.5 * (ip + ea))**2 / (2 * (ip - ea))
-    assert_almost_equal(model.electrophilicity, -electrophil, decimal=6)
-    nucleofugal = (ip - 3 * ea)**2 / (8 * (ip - ea))
-    assert_almost_equal(model.nucleofugality, nucleofugal, decimal=6)
-    electrofugal = (3 * ip - ea)**2 / (8 * (ip - ea))
-    assert_almost_equal(model.electrofugality, -electrofugal, decimal=6)
-    # check chemical potential, chemical hardness, and related tools
-    assert_almost_equal(model.chemical_potential, -0.5 * (ip + ea), decimal=6)
-    assert_almost_equal(model.chemical_hardness, ip - ea, decimal=6)
-    assert_almost_equal(model.mu, -0.5 * (ip + ea), decimal=6)
-    assert_almost_equal(model.eta, ip - ea, decimal=6)
-    assert_almost_equal(model.hyper_hardness(2), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_hardness(3), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_hardness(4), 0.0, decimal=6)
-    assert_almost_equal(model.softness, 1.0 / (ip - ea), decimal=6)
-
-
-def test_global_quadratic_pnp_grand_potential_n():
-    # E(N) = 30.0 + (-6.0)*N + 3*N^2, N0=10
-    _, _, grand = make_symbolic_quadratic_model(3.0, -6.0, 30.0)
+@pytest.mark.parametrize("dict_energy, coeffs, n_max", QUADRATIC_ENERGY_MODELS)
+def test_global_quadratic_grand_potential_n(dict_energy, coeffs, n_max):
+    _, _, grand = make_symbolic_quadratic_model(*coeffs)
     # build global tool
-    model = QuadraticGlobalTool({5: 75.0, 6: 102.0, 4: 54.0})
-    # check grand potential (as a function of N)
-    assert_almost_equal(model.grand_potential(5.), grand(5.), decimal=6)
-    assert_almost_equal(model.grand_potential(5.75), grand(5.75), decimal=6)
-    assert_almost_equal(model.grand_potential(6.3), grand(6.3), decimal=6)
-    assert_almost_equal(model.grand_potential(4.21), grand(4.21), decimal=6)
-    assert_almost_equal(model.grand_potential(10.), grand(10.), decimal=6)
-    assert_almost_equal(model.grand_potential(15.6), grand(15.6), decimal=6)
-    # check grand potential derivative (as a function of N)
-    assert_almost_equal(model.grand_potential_derivative(4.), -4, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(5.), -5, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(6., 1), -6, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(3.0123), -3.0123, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(7.2, 1), -7.2, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(8.1, 2), -1 / 6., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(6.12, 2), -1 / 6., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(5.1, 3), 0., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(6.3, 4), 0., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(7.45, 5), 0., decimal=6)
-
-
-def test_global_quadratic_pnp_grand_potential_mu():
-    # E(N) = 30.0 + (-6.0)*N + 3*N^2, N0=10
-    _, deriv, grand = make_symbolic_quadratic_model(3.0, -6.0, 30.0)
+    model = QuadraticGlobalTool(dict_energy)
+    # check grand potential (as a function of N) evaluated on a batch of N values
+    n_values = model.n0 + np.array([0., -1., 1., 0.2, -0.38, -3.5])
+    assert_allclose(model.grand_potential(n_values), grand(n_values), atol=1.e-6)
+    # check 1st-order grand potential derivative (as a function of N)
+    n_values = model.n0 + np.array([-1., 0., 1., 0.001, -0.33, 1.91, 2.125])
+    assert_allclose([model.grand_potential_derivative(n) for n in n_values],
+                    -n_values, atol=1.e-6)
+    assert_allclose([model.grand_potential_derivative(n, 1) for n in n_values],
+                    -n_values, atol=1.e-6)
+    # check 2nd-order grand potential derivative, i.e. -1/(2a)
+    n_values = model.n0 + np.array([0., 0.89, -0.97, 1.51])
+    assert_allclose([model.grand_potential_derivative(n, 2) for n in n_values],
+                    -0.5 / coeffs[0], atol=1.e-6)
+    # check higher-order grand potential derivatives
+    assert_allclose(np.array([model.grand_potential_derivative(model.n0 + shift, order)
+                              for shift, order in ((0., 3), (-1., 4), (2.5, 5))], dtype=float),
+                    0.0, atol=1.e-6)
+
+
+@pytest.mark.parametrize("dict_energy, coeffs, n_max", QUADRATIC_ENERGY_MODELS)
+def test_global_quadratic_grand_potential_mu(dict_energy, coeffs, n_max):
+    _, deriv, grand = make_symbolic_quadratic_model(*coeffs)
     # build global tool
-    model = QuadraticGlobalTool({5: 75.0, 6: 102.0, 4: 54.0})
+    model = QuadraticGlobalTool(dict_energy)
     # check mu to N conversion
-    assert_almost_equal(model.convert_mu_to_n(24.0), 5., decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(30.06), 6.01, decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(20.16), 4.36, decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(24.15), 5.025, decimal=6)
+    n_values = model.n0 + np.array([0., 0.002, -0.764, 1.981])
+    assert_allclose([model.convert_mu_to_n(deriv(n)) for n in n_values], n_values, atol=1.e-6)
     # check grand potential (as a function of mu)
-    assert_almost_equal(model.grand_potential_mu(deriv(5.15)), grand(5.15), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(3.2)), grand(3.2), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(7.67)), grand(7.67), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(5.15)), grand(5.15), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(6.31)), grand(6.31), decimal=6)
+    n_values = model.n0 + np.array([0., -1., 1., -1.3, -0.2, -2.7, 0.05])
+    assert_allclose([model.grand_potential_mu(deriv(n)) for n in n_values],
+                    grand(n_values), atol=1.e-6)
     # check grand potential derivative (as a function of mu)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(5.81), 1), -5.81, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(4.2), 1), -4.2, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(5.81), 2), -1/6., decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(4.89), 2), -1/6., decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(6.79), 3), 0., decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(3.12), 4), 0., decimal=6)
-
-
-def test_global_quadratic_pnp_grand_potential_reactivity():
-    # E(N) = 30.0 + (-6.0)*N + 3*N^2, N0=10
-    model = QuadraticGlobalTool({5: 75.0, 6: 102.0, 4: 54.0})
-    # check hyper-softnesses
-    assert_almost_equal(model.hyper_softness(2), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_softness(3), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_softness(4), 0.0, decimal=6)
-
-
-def test_global_quadratic_n0p_energy():
-    # E(N) = -100 + 5*N^2, N0=5
-    energy, deriv, _ = make_symbolic_quadratic_model(5.0, 0., -100.)
-    # build global tool
-    model = QuadraticGlobalTool({5: 25.0, 6: 80.0, 4: -20.0})
-    # check parameters
-    assert_almost_equal(model.params[0], -100.0, decimal=6)
-    assert_almost_equal(model.params[1], 0.0, decimal=6)
-    assert_almost_equal(model.params[2], 5.0, decimal=6)
-    assert_almost_equal(model.n0, 5, decimal=6)
-    assert_almost_equal(model.n_max, 0.0, decimal=6)
-    # check E(N)
-    assert_almost_equal(model.energy(20), energy(20), decimal=6)
-    assert_almost_equal(model.energy(10), energy(10), decimal=6)
-    assert_almost_equal(model.energy(16.5), energy(16.5), decimal=6)
-    # check dE(N)
-    assert_almost_equal(model.energy_derivative(20), deriv(20), decimal=6)
-    assert_almost_equal(model.energy_derivative(10), deriv(10), decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5), deriv(16.5), decimal=6)
-    # check d2E(N)
-    assert_almost_equal(model.energy_derivative(20, 2), 10.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 2), 10.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5, 2), 10.0, decimal=6)
-    # check d^nE(N) for n > 2
-    assert_almost_equal(model.energy_derivative(20, 3), 0.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(10, 4), 0.0, decimal=6)
-    assert_almost_equal(model.energy_derivative(16.5, 5), 0.0, decimal=6)
-
-
-def test_global_quadratic_n0p_energy_reactivity():
-    # E(N) = -100 + 5*N^2, N0=5
-    energy, _, _ = make_symbolic_quadratic_model(5.0, 0., -100.)
-    ip = energy(4) - energy(5)
-    ea = energy(5) - energy(6)
-    # build global tool
-    model = QuadraticGlobalTool({5: 25.0, 6: 80.0, 4: -20.0})
-    # check ionization potential and electron affinity
-    assert_almost_equal(model.ionization_potential, ip, decimal=6)
-    assert_almost_equal(model.electron_affinity, ea, decimal=6)
-    assert_almost_equal(model.ip, ip, decimal=6)
-    assert_almost_equal(model.ea, ea, decimal=6)
-    assert_almost_equal(model.electronegativity, 0.5 * (ip + ea), decimal=6)
-    electrophil = (-0.5 * (ip + ea))**2 / (2 * (ip - ea))
-    assert_almost_equal(model.electrophilicity, -electrophil, decimal=6)
-    nucleofugal = (ip - 3 * ea)**2 / (8 * (ip - ea))
-    assert_almost_equal(model.nucleofugality, nucleofugal, decimal=6)
-    electrofugal = (3 * ip - ea)**2 / (8 * (ip - ea))
-    assert_almost_equal(model.electrofugality, -electrofugal, decimal=6)
-    # check chemical potential, chemical hardness, and related tools
-    assert_almost_equal(model.chemical_potential, -0.5 * (ip + ea), decimal=6)
-    assert_almost_equal(model.chemical_hardness, ip - ea, decimal=6)
-    assert_almost_equal(model.mu, -0.5 * (ip + ea), decimal=6)
-    assert_almost_equal(model.eta, ip - ea, decimal=6)
-    assert_almost_equal(model.hyper_hardness(2), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_hardness(3), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_hardness(4), 0.0, decimal=6)
-    assert_almost_equal(model.softness, 1.0 / (ip - ea), decimal=6)
-
-
-def test_global_quadratic_n0p_grand_potential_n():
-    # E(N) = -100 + 5*N^2, N0=5
-    _, _, grand = make_symbolic_quadratic_model(5.0, 0., -100.)
-    # build global tool
-    model = QuadraticGlobalTool({5: 25.0, 6: 80.0, 4: -20.0})
-    # check grand potential (as a function of N)
-    assert_almost_equal(model.grand_potential(5.), grand(5.), decimal=6)
-    assert_almost_equal(model.grand_potential(4.), grand(4.), decimal=6)
-    assert_almost_equal(model.grand_potential(6.), grand(6.), decimal=6)
-    assert_almost_equal(model.grand_potential(4.678), grand(4.678), decimal=6)
-    assert_almost_equal(model.grand_potential(6.123), grand(6.123), decimal=6)
-    # check grand potential derivative (as a function of N)
-    assert_almost_equal(model.grand_potential_derivative(5.), -5, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(4., 1), -4, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(6.), -6, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(5.6001), -5.6001, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(4.145, 1), -4.145, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(5., 2), -0.1, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(7.001, 2), -0.1, decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(5., 3), 0., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(1.25, 4), 0., decimal=6)
-    assert_almost_equal(model.grand_potential_derivative(6.5, 5), 0., decimal=6)
-
-
-def test_global_quadratic_n0p_grand_potential_mu():
-    # E(N) = -100 + 5*N^2, N0=5
-    _, deriv, grand = make_symbolic_quadratic_model(5.0, 0., -100.)
+    n_values = model.n0 + np.array([0.05, 1.34, -0.69])
+    assert_allclose([model.grand_potential_mu_derivative(deriv(n), 1) for n in n_values],
+                    -n_values, atol=1.e-6)
+    n_values = model.n0 + np.array([0.61, 1.67])
+    assert_allclose([model.grand_potential_mu_derivative(deriv(n), 2) for n in n_values],
+                    -0.5 / coeffs[0], atol=1.e-6)
+    assert_allclose(np.array([model.grand_potential_mu_derivative(deriv(model.n0 + shift), order)
+                              for shift, order in ((-0.69, 3), (-2.33, 4))], dtype=float),
+                    0., atol=1.e-6)
+
+
+@pytest.mark.parametrize("dict_energy, coeffs, n_max", QUADRATIC_ENERGY_MODELS)
+def test_global_quadratic_grand_potential_reactivity(dict_energy, coeffs, n_max):
     # build global tool
-    model = QuadraticGlobalTool({5: 25.0, 6: 80.0, 4: -20.0})
-    # check mu to N conversion
-    assert_almost_equal(model.convert_mu_to_n(50), 5., decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(34.6), 3.46, decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(69.8), 6.98, decimal=6)
-    assert_almost_equal(model.convert_mu_to_n(100.0), 10., decimal=6)
-    # check grand potential (as a function of mu)
-    assert_almost_equal(model.grand_potential_mu(deriv(5.)), grand(5.), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(5.641)), grand(5.641), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(4.56)), grand(4.56), decimal=6)
-    assert_almost_equal(model.grand_potential_mu(deriv(3.905)), grand(3.905), decimal=6)
-    # check grand potential derivative (as a function of mu)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(5.81), 1), -5.81, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(4.341), 1), -4.341, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(6.452), 1), -6.452, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(3.678), 2), -0.1, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(4.341), 2), -0.1, decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(2.001), 3), 0., decimal=6)
-    assert_almost_equal(model.grand_potential_mu_derivative(deriv(5.456), 4), 0., decimal=6)
-
-
-def test_global_quadratic_n0p_grand_potential_reactivity():
-    # E(N) = -100 + 5*N^2, N0=5
-    model = QuadraticGlobalTool({5: 25.0, 6: 80.0, 4: -20.0})
+    model = QuadraticGlobalTool(dict_energy)
     # check hyper-softnesses
-    assert_almost_equal(model.hyper_softness(2), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_softness(3), 0.0, decimal=6)
-    assert_almost_equal(model.hyper_softness(4), 0.0, decimal=6)
+    assert_allclose(np.array([model.hyper_softness(order) for order in (2, 3, 4)], dtype=float),
+                    0.0, atol=1.e-6)
+
+
+def test_global_quadratic_batch_descriptors():
+    # build one model per case & collect their ip/ea into arrays
+    models = [QuadraticGlobalTool(dict_energy) for dict_energy, _, _ in QUADRATIC_ENERGY_MODELS]
+    ip = np.array([model.ip for model in models])
+    ea = np.array([model.ea for model in models])
+    # check batched descriptors against the per-instance properties
+    descriptors = QuadraticGlobalTool.batch_descriptors(ip, ea)
+    for name in ("mu", "eta", "softness", "electronegativity", "electrophilicity",
+                 "nucleofugality", "electrofugality"):
+        assert_allclose(descriptors[name], [getattr(model, name) for model in models],
+                        atol=1.e-6, err_msg=name)
+    assert_allclose(descriptors["dn_max"], [model.n_max - model.n0 for model in models],
+                    atol=1.e-6)
 
 
 def test_local_quadratic_raises_dict_density():
@@ -22,8 +22,11 @@
 # --
 """Test chemtools.conceptual.rational Module."""
 
+import math
+
+import numpy as np
 import sympy as sp
-from numpy.testing import assert_raises, assert_equal, assert_almost_equal
+from numpy.testing import assert_raises, assert_equal, assert_almost_equal, assert_allclose
 from chemtools.conceptual.rational import RationalGlobalTool
 
 
@@ -37,6 +40,16 @@ def make_symbolic_rational_model(a, b, c, d):
     return expr
 
 
+def make_analytical_rational_hyper_hardness(a0, a1, b1, n0):
+    """Return closed-form hyper-hardness of the rational model as a function of order k.
+
+    The k-th order hyper-hardness is the (k + 1)-th energy derivative at N0, which for the
+    rational model is (-b1)**k * (a1 - a0*b1) * (k + 1)! / (1 + b1*N0)**(k + 2).
+    """
+    return lambda k: ((-b1)**k * (a1 - a0 * b1) * math.factorial(k + 1)
+                      / (1. + b1 * n0)**(k + 2))
+
+
 def make_analytical_rational_grand_derivatives(deriv):
     """Return analytical 3rd and 4th derivatives of rational grand potential w.r.t. N."""
     expr = (lambda n: -1.0/deriv(n, 2),
@@ -82,7 +95,7 @@ def test_global_rational_raises():
 
 def test_global_rational_pnpp_energy():
     # E(N) = (0.5 - 2.2 N) / (1 + 0.7 N)
-    energy, deriv, _ = make_symbolic_rational_model(0.5, -2.2, 1., 0.7)
+    _, deriv, _ = make_symbolic_rational_model(0.5, -2.2, 1., 0.7)
     # Build rational global tool instance
     model = RationalGlobalTool({2.: -1.6250, 3.: -1.96774193, 1.: -1.0})
     # check parameters
@@ -90,34 +103,17 @@ def test_global_rational_pnpp_energy():
     assert_almost_equal(model.params[0], 0.5, decimal=6)
     assert_almost_equal(model.params[1], -2.2, decimal=6)
     assert_almost_equal(model.params[2], 0.7, decimal=6)
-    # check energy values (expected values are computed symbolically)
-    assert_almost_equal(model.energy(0), energy(0), decimal=6)
-    assert_almost_equal(model.energy(1), energy(1), decimal=6)
-    assert_almost_equal(model.energy(2), energy(2), decimal=6)
-    assert_almost_equal(model.energy(3), energy(3), decimal=6)
-    assert_almost_equal(model.energy(4), energy(4), decimal=6)
-    assert_almost_equal(model.energy(5), energy(5), decimal=6)
-    assert_almost_equal(model.energy(6), energy(6), decimal=6)
-    assert_almost_equal(model.energy(1.5), energy(1.5), decimal=6)
-    assert_almost_equal(model.energy(0.8), energy(0.8), decimal=6)
-    # check energy derivatives (expected values are computed symbolically)
-    assert_almost_equal(model.energy_derivative(0), deriv(0, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(1), deriv(1, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(2), deriv(2, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(3), deriv(3, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(4), deriv(4, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(5), deriv(5, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(6), deriv(6, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(1.5), deriv(1.5, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(0.8), deriv(0.8, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(1.5, 2), deriv(1.5, 2), decimal=6)
-    assert_almost_equal(model.energy_derivative(0.8, 2), deriv(0.8, 2), decimal=6)
-    assert_almost_equal(model.energy_derivative(1.1, 3), deriv(1.1, 3), decimal=6)
-    assert_almost_equal(model.energy_derivative(2.5, 4), deriv(2.5, 4), decimal=6)
-    assert_almost_equal(model.energy_derivative(0.65, 5), deriv(0.65, 5), decimal=5)
-    assert_almost_equal(model.energy_derivative(1.90, 6), deriv(1.90, 6), decimal=6)
-    assert_almost_equal(model.energy_derivative(3.20, 3), deriv(3.20, 3), decimal=6)
-    assert_almost_equal(model.energy_derivative(4.05, 7), deriv(4.05, 7), decimal=6)
+    # check energy values on an array of N (expected values in closed analytic form)
+    n_values = np.array([0., 1., 2., 3., 4., 5., 6., 1.5, 0.8])
+    assert_allclose(model.energy(n_values), (0.5 - 2.2 * n_values) / (1. + 0.7 * n_values),
+                    atol=1.e-6)
+    # check 1st-order energy derivatives (expected values are computed symbolically)
+    assert_allclose(np.array([model.energy_derivative(n) for n in n_values]),
+                    np.array([deriv(n, 1) for n in n_values]), atol=1.e-6)
+    # check higher-order energy derivatives (expected values are computed symbolically)
+    n_orders = [(1.5, 2), (0.8, 2), (1.1, 3), (2.5, 4), (0.65, 5), (1.9, 6), (3.2, 3), (4.05, 7)]
+    assert_allclose(np.array([model.energy_derivative(n, order) for n, order in n_orders]),
+                    np.array([deriv(n, order) for n, order in n_orders]), atol=1.e-5)
 
 
 def test_global_rational_pnpp_energy_reactivity():
@@ -135,11 +131,11 @@ def test_global_rational_pnpp_energy_reactivity():
     assert_almost_equal(model.chemical_potential, deriv(2.0, 1), decimal=6)
     assert_almost_equal(model.chemical_hardness, deriv(2.0, 2), decimal=6)
     assert_almost_equal(model.electronegativity, -deriv(2.0, 1), decimal=6)
-    assert_almost_equal(model.hyper_hardness(2), deriv(2.0, 3), decimal=6)
-    assert_almost_equal(model.hyper_hardness(3), deriv(2.0, 4), decimal=6)
-    assert_almost_equal(model.hyper_hardness(4), deriv(2.0, 5), decimal=6)
-    assert_almost_equal(model.hyper_hardness(5), deriv(2.0, 6), decimal=6)
-    assert_almost_equal(model.hyper_hardness(6), deriv(2.0, 7), decimal=6)
+    # check hyper-hardnesses (expected values in closed analytic form)
+    hyper = make_analytical_rational_hyper_hardness(0.5, -2.2, 0.7, 2.0)
+    orders = range(2, 7)
+    assert_allclose(np.array([model.hyper_hardness(k) for k in orders]),
+                    np.array([hyper(k) for k in orders]), atol=1.e-6)
     assert_almost_equal(model.softness, 1.0 / deriv(2.0, 2), decimal=6)
     # check n_max and related descriptors (expected values are computed symbolically)
     assert_equal(model.n_max, float('inf'))
@@ -157,13 +153,10 @@ def test_global_rational_pnpp_grand_potential():
     _, deriv, grand = make_symbolic_rational_model(0.5, -2.2, 1., 0.7)
     # Build rational global tool instance
     model = RationalGlobalTool({2.: -1.6250, 3.: -1.96774193, 1.: -1.0})
-    # check grand potential (as a function of N)
-    assert_almost_equal(model.grand_potential(1.), grand(1.), decimal=6)
-    assert_almost_equal(model.grand_potential(2.), grand(2.0), decimal=6)
-    assert_almost_equal(model.grand_potential(3.), grand(3.0), decimal=6)
-    assert_almost_equal(model.grand_potential(2.78), grand(2.78), decimal=6)
-    assert_almost_equal(model.grand_potential(5.2), grand(5.2), decimal=6)
-    assert_almost_equal(model.grand_potential(0.), grand(0.), decimal=6)
+    # check grand potential (as a function of N) evaluated on a batch of N values
+    n_values = np.array([1., 2., 3., 2.78, 5.2, 0.])
+    assert_allclose([model.grand_potential(n) for n in n_values],
+                    [grand(n) for n in n_values], atol=1.e-6)
     # assert_almost_equal(model.grand_potential(model.n_max), , decimal=6)
     # check grand potential derivative (as a function of N)
     assert_almost_equal(model.grand_potential_derivative(2.), -2.0, decimal=6)
@@ -216,7 +209,7 @@ def test_global_rational_pnpp_grand_potential_reactivity():
 
 def test_global_rational_nnpp_energy():
     # E(N) = (-0.15 - 4.2 N) / (1 + 0.45 N)
-    energy, deriv, _ = make_symbolic_rational_model(-0.15, -4.2, 1., 0.45)
+    _, deriv, _ = make_symbolic_rational_model(-0.15, -4.2, 1., 0.45)
     # build global tool
     model = RationalGlobalTool({6.5: -6.99363057, 7.5: -7.23428571, 5.5: -6.69064748})
     # check parameters
@@ -224,19 +217,14 @@ def test_global_rational_nnpp_energy():
     assert_almost_equal(model.params[0], -0.15, decimal=6)
     assert_almost_equal(model.params[1], -4.2, decimal=6)
     assert_almost_equal(model.params[2], 0.45, decimal=6)
-    # check energy values (expected values are computed symbolically)
-    assert_almost_equal(model.energy(6.5), energy(6.5), decimal=6)
-    assert_almost_equal(model.energy(7.5), energy(7.5), decimal=6)
-    assert_almost_equal(model.energy(5.5), energy(5.5), decimal=6)
-    assert_almost_equal(model.energy(5.0), energy(5.0), decimal=6)
-    assert_almost_equal(model.energy(8.0), energy(8.0), decimal=6)
+    # check energy values on an array of N (expected values in closed analytic form)
+    n_values = np.array([6.5, 7.5, 5.5, 5.0, 8.0])
+    assert_allclose(model.energy(n_values), (-0.15 - 4.2 * n_values) / (1. + 0.45 * n_values),
+                    atol=1.e-6)
     # check energy derivatives (expected values are computed symbolically)
-    assert_almost_equal(model.energy_derivative(6.5), deriv(6.5, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(7.5), deriv(7.5, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(5.5), deriv(5.5, 1), decimal=6)
-    assert_almost_equal(model.energy_derivative(4, 2), deriv(4.0, 2), decimal=6)
-    assert_almost_equal(model.energy_derivative(10., 3), deriv(10., 3), decimal=6)
-    assert_almost_equal(model.energy_derivative(9.5, 4), deriv(9.5, 4), decimal=6)
+    n_orders = [(6.5, 1), (7.5, 1), (5.5, 1), (4.0, 2), (10., 3), (9.5, 4)]
+    assert_allclose(np.array([model.energy_derivative(n, order) for n, order in n_orders]),
+                    np.array([deriv(n, order) for n, order in n_orders]), atol=1.e-6)
 
 
 def test_global_rational_nnpp_energy_reactivity():
@@ -254,11 +242,11 @@ def test_global_rational_nnpp_energy_reactivity():
     assert_almost_equal(model.chemical_potential, deriv(6.5, 1), decimal=6)
     assert_almost_equal(model.chemical_hardness, deriv(6.5, 2), decimal=6)
     assert_almost_equal(model.electronegativity, -deriv(6.5, 1), decimal=6)
-    assert_almost_equal(model.hyper_hardness(2), deriv(6.5, 3), decimal=6)
-    assert_almost_equal(model.hyper_hardness(3), deriv(6.5, 4), decimal=6)
-    assert_almost_equal(model.hyper_hardness(4), deriv(6.5, 5), decimal=6)
-    assert_almost_equal(model.hyper_hardness(5), deriv(6.5, 6), decimal=6)
-    assert_almost_equal(model.hyper_hardness(6), deriv(6.5, 7), decimal=6)
+    # check hyper-hardnesses (expected values in closed analytic form)
+    hyper = make_analytical_rational_hyper_hardness(-0.15, -4.2, 0.45, 6.5)
+    orders = range(2, 7)
+    assert_allclose(np.array([model.hyper_hardness(k) for k in orders]),
+                    np.array([hyper(k) for k in orders]), atol=1.e-6)
     assert_almost_equal(model.softness, 1. / deriv(6.5, 2), decimal=6)
     # check n_max and related descriptors (expected values are computed symbolically)
     assert_equal(model.n_max, float('inf'))
@@ -276,10 +264,10 @@ def test_global_rational_nnpp_grand_potential():
     _, deriv, _ = make_symbolic_rational_model(-0.15, -4.2, 1., 0.45)
     # build global tool
     model = RationalGlobalTool({6.5: -6.99363057, 7.5: -7.23428571, 5.5: -6.69064748})
-    # check grand potential (as a function of N)
-    assert_almost_equal(model.grand_potential(6.5), -5.2500304, decimal=6)
-    assert_almost_equal(model.grand_potential(7.91), -5.7468530, decimal=6)
-    assert_almost_equal(model.grand_potential(0.), -0.15, decimal=6)
+    # check grand potential (as a function of N) evaluated on a batch of N values
+    n_values = np.array([6.5, 7.91, 0.])
+    assert_allclose([model.grand_potential(n) for n in n_values],
+                    [-5.2500304, -5.7468530, -0.15], atol=1.e-6)
     # assert_almost_equal(model.grand_potential(model.n_max), , decimal=6)
     # check grand potential derivative (as a function of N)
     # expected values based on derived formulas
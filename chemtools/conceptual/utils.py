@@ -25,6 +25,8 @@
 
 import logging
 
+import numpy as np
+
 
 __all__ = ["check_dict_values", "check_number_electrons"]
 
@@ -66,18 +68,22 @@ def check_number_electrons(n_elec, n_min, n_max):
 
     Parameters
     ----------
-    n_elec : float
-        Number of electrons.
+    n_elec : float or np.ndarray
+        Number of electrons, or array of numbers of electrons.
     n_min : float
         Minimum number of electrons used for interpolation.
     n_max : float
         Maximum number of electrons used for interpolation.
     """
-    if not isinstance(n_elec, (int, float)):
-        raise ValueError("Number of electrons should be a single number. "
+    if isinstance(n_elec, np.ndarray) and n_elec.dtype.kind in "iuf":
+        n_elec_min, n_elec_max = np.min(n_elec), np.max(n_elec)
+    elif isinstance(n_elec, (int, float)):
+        n_elec_min = n_elec_max = n_elec
+    else:
+        raise ValueError("Number of electrons should be a single number or an array of numbers. "
                          "Given n_elec={0}".format(n_elec))
-    if n_elec < 0.0:
+    if n_elec_min < 0.0:
         raise ValueError("Number of electrons cannot be negative! n_elec={0}".format(n_elec))
-    if not n_min <= n_elec <= n_max:
+    if not (n_min <= n_elec_min and n_elec_max <= n_max):
         logging.warning("Property evaluated for n_elec={0} outside of interpolation "
                         "region [{1}, {2}].".format(n_elec, n_min, n_max))
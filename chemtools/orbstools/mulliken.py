@@ -1,4 +1,6 @@
 """Mulliken population analysis."""
+import warnings
+
 import numpy as np
 from chemtools.orbstools.orthogonalization import power_symmetric
 from chemtools.orbstools.quasi import project
@@ -204,7 +206,7 @@ def mulliken_populations(
     if not np.all(occupations >= 0):
         raise ValueError("Occupation numbers must be greater than or equal to 0.")
     if np.any(occupations > 2):
-        print("WARNING: Atleast one occupation number exceeds 2.")
+        warnings.warn("Atleast one occupation number exceeds 2.", RuntimeWarning)
 
     # Check basis mapping
     if ab_atom_indices.size != olp_ab_ab.shape[0]:
@@ -275,7 +277,7 @@ def mulliken_populations(
     #     output[atom_ind] = np.sum(olp_ab_ab * density.T * weights)
 
     if not abs(np.sum(occupations) - np.sum(output)) < 1e-6:
-        print("WARNING: Population does not match up with the number of electrons.")
+        warnings.warn("Population does not match up with the number of electrons.", RuntimeWarning)
 
     return output
 
@@ -1,4 +1,6 @@
 """Tools for matrix decomposition and power."""
+import warnings
+
 import numpy as np
 
 
@@ -58,16 +60,18 @@ def eigh(matrix, threshold=1e-9):
 
     neg_indices = eigval < -threshold
     if np.any(neg_indices):
-        print(
-            "WARNING: {0} eigenvalues are negative (less than the threshold {1}):\n"
-            "{2}".format(np.sum(neg_indices), -threshold, eigval[neg_indices])
+        warnings.warn(
+            "{0} eigenvalues are negative (less than the threshold {1}):\n"
+            "{2}".format(np.sum(neg_indices), -threshold, eigval[neg_indices]),
+            RuntimeWarning,
         )
 
     kept_indices = np.abs(eigval) > threshold
     if np.sum(~kept_indices) > 0:
-        print(
-            "WARNING: Discarded {0} eigenvalues because they are less than the threshold {1}:\n"
-            "{2}".format(np.sum(~kept_indices), threshold, eigval[~kept_indices])
+        warnings.warn(
+            "Discarded {0} eigenvalues because they are less than the threshold {1}:\n"
+            "{2}".format(np.sum(~kept_indices), threshold, eigval[~kept_indices]),
+            RuntimeWarning,
         )
 
     eigval, eigvec = eigval[kept_indices], eigvec[:, kept_indices]
@@ -120,9 +124,10 @@ def svd(matrix, threshold=1e-9):
 
     kept_indices = sigma > threshold
     if np.sum(~kept_indices) > 0:
-        print(
-            "WARNING: Discarded {0} singular values because they are less than the threshold {1}:\n"
-            "{2}".format(np.sum(~kept_indices), threshold, sigma[~kept_indices])
+        warnings.warn(
+            "Discarded {0} singular values because they are less than the threshold {1}:\n"
+            "{2}".format(np.sum(~kept_indices), threshold, sigma[~kept_indices]),
+            RuntimeWarning,
         )
 
     u, sigma, vdagger = u[:, kept_indices], sigma[kept_indices], vdagger[kept_indices, :]
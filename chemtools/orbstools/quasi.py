@@ -1,4 +1,6 @@
 """Module for making Quasiatomic orbitals."""
+import warnings
+
 import numpy as np
 from chemtools.orbstools import orthogonalization as orth
 
@@ -212,11 +214,12 @@ def project(olp_one_one, olp_one_two):
     # Check linear dependence
     rank = np.linalg.matrix_rank(coeff_one_proj)
     if rank < coeff_one_proj.shape[1]:
-        print(
-            "Warning: There are {0} linearly dependent projections. The transformation matrix has a"
+        warnings.warn(
+            "There are {0} linearly dependent projections. The transformation matrix has a"
             " shape of {1} and rank of {2}".format(
                 coeff_one_proj.shape[1] - rank, coeff_one_proj.shape, rank
-            )
+            ),
+            RuntimeWarning,
         )
     return coeff_one_proj
 
@@ -140,7 +140,8 @@ class TopologicalTool(Topology):
                 revert = True
             grad = molecule.compute_gradient(point, spin, index)
             if revert:
-                grad = grad.flatten()
+                # return a view of the single-point row instead of a flattened copy
+                grad = grad[0]
             return grad
         return compute_gradient
 
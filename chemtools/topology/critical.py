@@ -119,37 +119,44 @@ class Topology(object):
 
     def find_critical_points(self):
         """Find and store the critical points."""
-        neighs = np.zeros((4 * len(self._kdtree.data), 3))
-        for index, point in enumerate(self._kdtree.data):
-            # compute distance to 4 closest grid points
-            dists, _ = self._kdtree.query(point, 4)
-            # store coordinates of neighbouring polyhedron vertices surrounding the point
-            neighs[4 * index: 4 * index + 4, :] = point + np.max(dists) * self._neighbours
+        points = self._kdtree.data
+        # compute distance to 4 closest grid points of every point in one batched query
+        dists, _ = self._kdtree.query(points, 4)
+        # coordinates of neighbouring polyhedron vertices surrounding each point
+        neighs = points[:, np.newaxis, :] + \
+            dists.max(axis=1)[:, np.newaxis, np.newaxis] * self._neighbours
+        neighs = neighs.reshape(-1, 3)
 
         # compute the gradient norm of points & surrounding vertices
-        points_norm = np.linalg.norm(self.grad(self._kdtree.data), axis=-1)
+        points_norm = np.linalg.norm(self.grad(points), axis=-1)
         neighs_norm = np.linalg.norm(self.grad(neighs), axis=-1)
 
-        for index, point in enumerate(self._kdtree.data):
-            point_norm = points_norm[index]
-            neigh_norm = neighs_norm[4 * index: 4 * index + 4]
-            # use central point as initial guess for critical point finding
-            if index < len(self._coords) or np.all(point_norm < neigh_norm):
-                try:
-                    coord = self._root_vector_func(point.copy())
-                except np.linalg.LinAlgError as _:
+        # use points whose gradient norm is lower than that of all surrounding vertices as
+        # initial guesses, always including the atomic centers (if given)
+        candidates = np.all(points_norm[:, np.newaxis] < neighs_norm.reshape(-1, 4), axis=1)
+        if self._coords is not None:
+            candidates[:len(self._coords)] = True
+
+        # coordinates of critical points found so far, for vectorized duplicate check
+        cp_coords = np.array([cp.coordinate for cp in self.cps]).reshape(-1, 3)
+
+        for point in points[candidates]:
+            try:
+                coord = self._root_vector_func(point.copy())
+            except np.linalg.LinAlgError as _:
+                continue
+            # add critical point if it is new
+            if not np.any(np.linalg.norm(cp_coords - coord, axis=1) < 1.e-3):
+                # skip critical point if its dens & grad are zero; the gradient is only
+                # evaluated when the density test passes to avoid a wasted function call
+                dens = self.func(coord)
+                if abs(dens) < 1.e-4 and np.all(abs(self.grad(coord)) < 1.e-4):
                     continue
-                # add critical point if it is new
-                if not np.any([np.linalg.norm(coord - cp.coordinate) < 1.e-3 for cp in self.cps]):
-                    dens = self.func(coord)
-                    grad = self.grad(coord)
-                    # skip critical point if its dens & grad are zero
-                    if abs(dens) < 1.e-4 and np.all(abs(grad) < 1.e-4):
-                        continue
-                    # compute rank & signature of critical point
-                    eigenvals, eigenvecs = np.linalg.eigh(self.hess(coord))
-                    cp = CriticalPoint(coord, eigenvals, eigenvecs, 1e-4)
-                    self._cps.setdefault((cp.rank[0], cp.signature[0]), []).append(cp)
+                # compute rank & signature of critical point
+                eigenvals, eigenvecs = np.linalg.eigh(self.hess(coord))
+                cp = CriticalPoint(coord, eigenvals, eigenvecs, 1e-4)
+                self._cps.setdefault((cp.rank[0], cp.signature[0]), []).append(cp)
+                cp_coords = np.vstack((cp_coords, coord))
         # check Poincare–Hopf equation
         if not self.poincare_hopf_equation:
             warnings.warn("Poincare–Hopf equation is not satisfied.", RuntimeWarning)
@@ -166,12 +173,14 @@ class Topology(object):
 
         """
         niter = 0
-        norm = np.inf
-        while niter < maxiter and norm > 1.0e-6:
+        while niter < maxiter:
             grad = self.grad(guess)
-            hess = self.hess(guess)
-            guess = guess - np.dot(np.linalg.inv(hess), grad[:, np.newaxis]).flatten()
-            norm = np.linalg.norm(grad, axis=-1)
+            # check convergence on the fresh gradient, so a converged guess is returned
+            # without paying for another hessian evaluation & Newton step
+            if np.linalg.norm(grad, axis=-1) <= 1.0e-6:
+                break
+            # solve the 3x3 Newton system directly instead of forming the inverse
+            guess = guess - np.linalg.solve(self.hess(guess), grad)
             niter += 1
         return guess
 
@@ -33,6 +33,8 @@ __all__ = ["EigenValueTool", "CriticalPoint"]
 class EigenValueTool(object):
     r"""Class of descriptive tools based on eigenvalues."""
 
+    __slots__ = ("_eigenvalues", "_eps", "_pos_mask", "_neg_mask", "_sorted", "_near_zero")
+
     def __init__(self, eigenvalues, eps=1e-15):
         r"""Initialize class.
 
@@ -44,18 +46,52 @@ class EigenValueTool(object):
             The error bound for being a zero eigenvalue.
 
         """
-        if not isinstance(eigenvalues, np.ndarray):
-            raise TypeError("Eigenvalues should be a numpy array.")
-        if not eigenvalues.ndim == 2:
-            raise TypeError("Eigenvalues should be a two dimensional array.")
+        # cast to contiguous float64 so reductions run on a cast-free, SIMD-friendly layout;
+        # this is a no-op for input that is already contiguous float64
+        try:
+            eigenvalues = np.ascontiguousarray(eigenvalues, dtype=float)
+        except (TypeError, ValueError):
+            raise TypeError("Eigenvalues should be castable to a numpy array of floats.")
+        if eigenvalues.ndim != 2 or eigenvalues.shape[1] == 0:
+            raise TypeError("Eigenvalues should be a two dimensional array of eigenvalues.")
         self._eigenvalues = eigenvalues
         self._eps = eps
+        # boolean masks of positive & negative eigenvalues and row-wise sorted eigenvalues,
+        # computed on first use & shared between descriptors
+        self._pos_mask = None
+        self._neg_mask = None
+        self._sorted = None
+        # whether any eigenvalue is near zero (catastrophic), computed on first use
+        self._near_zero = None
 
     @property
     def eigenvalues(self):
         r"""Eigenvalues."""
         return self._eigenvalues
 
+    def _sign_masks(self):
+        r"""Return cached boolean masks of positive & negative eigenvalues."""
+        if self._pos_mask is None:
+            eigenvalues, eps = self._eigenvalues, self._eps
+            self._pos_mask = eigenvalues > eps
+            self._neg_mask = eigenvalues < -eps
+        return self._pos_mask, self._neg_mask
+
+    def _sorted_eigenvalues(self):
+        r"""Return cached row-wise sorted eigenvalues."""
+        if self._sorted is None:
+            eigenvalues = self._eigenvalues
+            if eigenvalues.shape[1] == 3:
+                # Hessian case: order the triple from its min, max & row sum instead of
+                # running the generic lexicographic sort
+                vmin = eigenvalues.min(axis=1)
+                vmax = eigenvalues.max(axis=1)
+                vmid = eigenvalues.sum(axis=1) - vmin - vmax
+                self._sorted = np.stack([vmin, vmid, vmax], axis=1)
+            else:
+                self._sorted = np.sort(eigenvalues, axis=1)
+        return self._sorted
+
     @property
     def ellipticity(self):
         r"""Ellipticity.
@@ -63,10 +99,9 @@ class EigenValueTool(object):
         .. math:: \frac{\lambda_\text{min}}{\lambda_\text{min-1}} - 1
 
         """
-        # get the two smallest eigenvalues
-        index = np.argsort(self.eigenvalues, axis=1)[:, :2]
-        min1 = self.eigenvalues[np.arange(self.eigenvalues.shape[0]), index[:, 0]]
-        min2 = self.eigenvalues[np.arange(self.eigenvalues.shape[0]), index[:, 1]]
+        # get the two smallest eigenvalues from the shared sorted array
+        sorted_eigenvalues = self._sorted_eigenvalues()
+        min1, min2 = sorted_eigenvalues[:, 0], sorted_eigenvalues[:, 1]
         # if np.abs(eigen2) < self._zero_eps:
         #    warnings.warn("Second largest eigenvalue is zero.")
         #     return np.inf
@@ -81,12 +116,16 @@ class EigenValueTool(object):
                 {\left(\frac{\sum_{\lambda_k < 0} \lambda_k}{\sum_{\lambda_k < 0} 1}\right)}
 
         """
-        # compute numerator
-        pos_mask = (self.eigenvalues > self._eps).astype(int)
-        result = np.sum(self.eigenvalues * pos_mask, axis=1) / np.sum(pos_mask, axis=1)
-        # compute denominator
-        neg_mask = (self.eigenvalues < -self._eps).astype(int)
-        result /= (np.sum(self.eigenvalues * neg_mask, axis=1) / np.sum(neg_mask, axis=1))
+        eigenvalues = self._eigenvalues
+        pos_mask, neg_mask = self._sign_masks()
+        n_pos = np.sum(pos_mask, axis=1)
+        n_neg = np.sum(neg_mask, axis=1)
+        pos_sum = np.sum(eigenvalues * pos_mask, axis=1)
+        neg_sum = np.sum(eigenvalues * neg_mask, axis=1)
+        # the descriptor is undefined for points lacking positive or negative eigenvalues
+        defined = (n_pos != 0) & (n_neg != 0)
+        result = np.full(eigenvalues.shape[0], np.nan)
+        result[defined] = (pos_sum[defined] / n_pos[defined]) / (neg_sum[defined] / n_neg[defined])
         return result
 
     @property
@@ -96,7 +135,8 @@ class EigenValueTool(object):
         .. math :: \sqrt{\frac{\lambda_\text{max}}{\lambda_\text{min}}}
 
         """
-        ratio = np.amax(self.eigenvalues, axis=1) / np.amin(self.eigenvalues, axis=1)
+        sorted_eigenvalues = self._sorted_eigenvalues()
+        ratio = sorted_eigenvalues[:, -1] / sorted_eigenvalues[:, 0]
         # set negative values to None
         ratio[ratio < 0.] = np.nan
         return np.sqrt(ratio)
@@ -108,7 +148,7 @@ class EigenValueTool(object):
         .. math:: \sum_{\lambda_k < 0} 1
 
         """
-        return np.sum(self._eigenvalues < -self._eps, axis=1)
+        return np.sum(self._sign_masks()[1], axis=1)
 
     @property
     def rank(self):
@@ -117,7 +157,8 @@ class EigenValueTool(object):
         .. math:: \sum_{\lambda_i > 0} 1
 
         """
-        return np.sum(np.abs(self._eigenvalues) > self._eps, axis=1)
+        pos_mask, neg_mask = self._sign_masks()
+        return np.sum(pos_mask | neg_mask, axis=1)
 
     @property
     def signature(self):
@@ -126,9 +167,8 @@ class EigenValueTool(object):
         .. math:: \sum_{\lambda_k > 0.} 1 - \sum_{\lambda_k < 0.} 1
 
         """
-        result = np.sum(self.eigenvalues > self._eps, axis=1)
-        result -= np.sum(self.eigenvalues < -self._eps, axis=1)
-        return result
+        pos_mask, neg_mask = self._sign_masks()
+        return np.sum(pos_mask, axis=1) - np.sum(neg_mask, axis=1)
 
     @property
     def morse(self):
@@ -141,14 +181,18 @@ class EigenValueTool(object):
         is said to be "catastrophe". It returns a warning in this case.
 
         """
-        if np.any(np.abs(self.eigenvalues) < self._eps):
+        if self._near_zero is None:
+            self._near_zero = bool(np.any(np.abs(self._eigenvalues) < self._eps))
+        if self._near_zero:
             warnings.warn("Near catastrophic eigenvalue (close to zero) been found.")
-        return np.hstack([self.rank[:, np.newaxis], self.signature[:, np.newaxis]])
+        return np.stack([self.rank, self.signature], axis=1)
 
 
 class CriticalPoint(EigenValueTool):
     """Critical Point Class."""
 
+    __slots__ = ("_coord", "_eigenvectors")
+
     def __init__(self, coordinate, eigenvalues, eigenvectors, eps=1e-15):
         r"""Initialize class.
 
@@ -79,8 +79,7 @@ class UniformGrid(object):
         npoints_x, npoints_y, npoints_z = self._shape
         # Total number of grid points
         self._npoints = npoints_x * npoints_y * npoints_z
-        # Make an array to store coordinates of grid points
-        self._points = np.zeros((self._npoints, 3))
+        # Make an array with the integer indices of the grid points
         coords = np.array(
             np.meshgrid(np.arange(npoints_x), np.arange(npoints_y), np.arange(npoints_z))
         )
@@ -118,14 +117,11 @@ class UniformGrid(object):
         com = np.dot(pseudo_numbers, coordinates) / totz
 
         if rotate:
-            # calculate moment of inertia tensor:
-            itensor = np.zeros([3, 3])
-            for i in range(pseudo_numbers.shape[0]):
-                xyz = coordinates[i] - com
-                r = np.linalg.norm(xyz)**2.0
-                tempitens = np.diag([r, r, r])
-                tempitens -= np.outer(xyz.T, xyz)
-                itensor += pseudo_numbers[i] * tempitens
+            # calculate moment of inertia tensor for all atoms at once
+            xyz = coordinates - com
+            r2 = np.sum(xyz * xyz, axis=1)
+            itensor = np.dot(pseudo_numbers, r2) * np.eye(3)
+            itensor -= np.dot(xyz.T * pseudo_numbers, xyz)
 
             _, v = np.linalg.eigh(itensor)
             new_coordinates = np.dot((coordinates - com), v)
@@ -395,7 +391,7 @@ class UniformGrid(object):
             numbers = np.zeros(natom, int)
             pseudo_numbers = np.zeros(natom, float)
             coordinates = np.zeros((natom, 3), float)
-            for i in xrange(natom):
+            for i in range(natom):
                 numbers[i], pseudo_numbers[i], coordinates[i] = read_coordinate_line(f.readline())
                 # If the pseudo_number field is zero, we assume that no effective core
                 # potentials were used.